@@ -64,6 +64,7 @@ class Farm(BaseClass):
 
     turbine_definitions: list = field(init=False, validator=iter_validator(list, dict))
     coordinates: List[Vec3] = field(init=False)
+    coordinates_array: NDArrayFloat = field(init=False)
     turbine_fCts: tuple = field(init=False, default=[])
     turbine_fTilts: list = field(init=False, default=[])
 
@@ -276,9 +277,10 @@ class Farm(BaseClass):
         self.turbine_power_interps = [turb.power_interp for turb in self.turbine_map]
 
     def construct_coordinates(self):
-        self.coordinates = np.array([
-            Vec3([x, y, z]) for x, y, z in zip(self.layout_x, self.layout_y, self.hub_heights)
-        ])
+        # Store the coordinates as an (n_turbines, 3) array of x, y, z components, and
+        # build the Vec3 objects from its rows
+        self.coordinates_array = np.column_stack((self.layout_x, self.layout_y, self.hub_heights))
+        self.coordinates = np.array([Vec3(c) for c in self.coordinates_array])
 
     def expand_farm_properties(
         self,
@@ -108,6 +108,7 @@ class Floris(BaseClass):
         if self.solver["type"] == "turbine_grid":
             self.grid = TurbineGrid(
                 turbine_coordinates=self.farm.coordinates,
+                turbine_coordinates_array=self.farm.coordinates_array,
                 reference_turbine_diameter=self.farm.rotor_diameters,
                 wind_directions=self.flow_field.wind_directions,
                 wind_speeds=self.flow_field.wind_speeds,
@@ -117,6 +118,7 @@ class Floris(BaseClass):
         elif self.solver["type"] == "turbine_cubature_grid":
             self.grid = TurbineCubatureGrid(
                 turbine_coordinates=self.farm.coordinates,
+                turbine_coordinates_array=self.farm.coordinates_array,
                 reference_turbine_diameter=self.farm.rotor_diameters,
                 wind_directions=self.flow_field.wind_directions,
                 wind_speeds=self.flow_field.wind_speeds,
@@ -126,6 +128,7 @@ class Floris(BaseClass):
         elif self.solver["type"] == "flow_field_grid":
             self.grid = FlowFieldGrid(
                 turbine_coordinates=self.farm.coordinates,
+                turbine_coordinates_array=self.farm.coordinates_array,
                 reference_turbine_diameter=self.farm.rotor_diameters,
                 wind_directions=self.flow_field.wind_directions,
                 wind_speeds=self.flow_field.wind_speeds,
@@ -135,6 +138,7 @@ class Floris(BaseClass):
         elif self.solver["type"] == "flow_field_planar_grid":
             self.grid = FlowFieldPlanarGrid(
                 turbine_coordinates=self.farm.coordinates,
+                turbine_coordinates_array=self.farm.coordinates_array,
                 reference_turbine_diameter=self.farm.rotor_diameters,
                 wind_directions=self.flow_field.wind_directions,
                 wind_speeds=self.flow_field.wind_speeds,
@@ -301,6 +305,7 @@ class Floris(BaseClass):
             points_y=y,
             points_z=z,
             turbine_coordinates=self.farm.coordinates,
+            turbine_coordinates_array=self.farm.coordinates_array,
             reference_turbine_diameter=self.farm.rotor_diameters,
             wind_directions=self.flow_field.wind_directions,
             wind_speeds=self.flow_field.wind_speeds,
@@ -14,12 +14,14 @@
 
 from __future__ import annotations
 
+import copy
+
 import attrs
 import matplotlib.path as mpltPath
 import numpy as np
 from attrs import define, field
 from scipy.interpolate import LinearNDInterpolator
-from scipy.spatial import ConvexHull
+from scipy.spatial import ConvexHull, Delaunay
 from shapely.geometry import Polygon
 
 from floris.simulation import (
@@ -64,6 +66,8 @@ class FlowField(BaseClass):
     turbulence_intensity_field_sorted: NDArrayFloat = field(init=False, default=np.array([]))
     turbulence_intensity_field_sorted_avg: NDArrayFloat = field(init=False, default=np.array([]))
 
+    _shear_profile_cache: tuple | None = field(init=False, default=None)
+
     @wind_speeds.validator
     def wind_speeds_validator(self, instance: attrs.Attribute, value: NDArrayFloat) -> None:
         """Using the validator method to keep the `n_wind_speeds` attribute up to date."""
@@ -114,6 +118,54 @@ class FlowField(BaseClass):
         if self.heterogenous_inflow_config is not None:
             self.generate_heterogeneous_wind_map()
 
+    def __deepcopy__(self, memo: dict) -> FlowField:
+        """Copies the flow field without the shear profile cache. The cache holds arrays the
+        size of the last grid, such as the full flow field grid when the flow field is copied
+        in the full flow solvers, and a copy computes its profiles again when initialized.
+        """
+        copied = copy.copy(self)
+        memo[id(self)] = copied
+        for attribute in attrs.fields(type(self)):
+            if attribute.name == "_shear_profile_cache":
+                value = None
+            else:
+                value = copy.deepcopy(getattr(self, attribute.name), memo)
+            object.__setattr__(copied, attribute.name, value)
+        return copied
+
+    def shear_profiles(self, grid: Grid) -> tuple[NDArrayFloat, NDArrayFloat]:
+        """Computes the shear-law wind profile and its vertical derivative on the grid
+        points. The profiles depend only on the grid heights, the wind shear, and the reference
+        wind height, so they are cached and reused while these are unchanged, such as when the
+        wake is repeatedly calculated for the same grid.
+
+        Args:
+            grid (Grid): The grid on which the profiles are computed.
+
+        Returns:
+            tuple[NDArrayFloat, NDArrayFloat]: The wind profile and its derivative with respect
+                to height, both with the shape of `grid.z_sorted`.
+        """
+        if self._shear_profile_cache is not None:
+            z_sorted, wind_shear, reference_wind_height, profiles = self._shear_profile_cache
+            if (
+                z_sorted is grid.z_sorted
+                and wind_shear == self.wind_shear
+                and reference_wind_height == self.reference_wind_height
+            ):
+                return profiles
+
+        wind_profile_plane = (grid.z_sorted / self.reference_wind_height) ** self.wind_shear
+        dwind_profile_plane = (
+            self.wind_shear
+            * (1 / self.reference_wind_height) ** self.wind_shear
+            * (grid.z_sorted) ** (self.wind_shear - 1)
+        )
+        profiles = (wind_profile_plane, dwind_profile_plane)
+        self._shear_profile_cache = (
+            grid.z_sorted, self.wind_shear, self.reference_wind_height, profiles
+        )
+        return profiles
 
     def initialize_velocity_field(self, grid: Grid) -> None:
 
@@ -127,12 +179,7 @@ class FlowField(BaseClass):
         # determined by this line. Since the right-most dimension on grid.z is storing the values
         # for height, using it here to apply the shear law makes that dimension store the vertical
         # wind profile.
-        wind_profile_plane = (grid.z_sorted / self.reference_wind_height) ** self.wind_shear
-        dwind_profile_plane = (
-            self.wind_shear
-            * (1 / self.reference_wind_height) ** self.wind_shear
-            * (grid.z_sorted) ** (self.wind_shear - 1)
-        )
+        wind_profile_plane, dwind_profile_plane = self.shear_profiles(grid)
 
         # If no hetergeneous inflow defined, then set all speeds ups to 1.0
         if self.het_map is None:
@@ -202,27 +249,26 @@ class FlowField(BaseClass):
                 (self.wind_speeds[None, :].T * dwind_profile_plane.T).T
                 * speed_ups
             )
-        self.v_initial_sorted = np.zeros(
-            np.shape(self.u_initial_sorted),
-            dtype=self.u_initial_sorted.dtype
-        )
-        self.w_initial_sorted = np.zeros(
-            np.shape(self.u_initial_sorted),
-            dtype=self.u_initial_sorted.dtype
-        )
+        self.v_initial_sorted = np.zeros_like(self.u_initial_sorted)
+        self.w_initial_sorted = np.zeros_like(self.u_initial_sorted)
 
+        # New arrays are allocated on each initialization since results from the previous
+        # calculation, such as those returned by Floris.solve_for_points, may be views into them.
+        # The transverse velocities start from zero, so they are allocated directly rather
+        # than copied from the initial arrays.
         self.u_sorted = self.u_initial_sorted.copy()
-        self.v_sorted = self.v_initial_sorted.copy()
-        self.w_sorted = self.w_initial_sorted.copy()
+        self.v_sorted = np.zeros_like(self.u_initial_sorted)
+        self.w_sorted = np.zeros_like(self.u_initial_sorted)
 
-        self.turbulence_intensity_field = self.turbulence_intensity * np.ones(
+        self.turbulence_intensity_field = np.full(
             (
                 self.n_wind_directions,
                 self.n_wind_speeds,
                 grid.n_turbines,
                 1,
                 1,
-            )
+            ),
+            self.turbulence_intensity,
         )
         self.turbulence_intensity_field_sorted = self.turbulence_intensity_field.copy()
 
@@ -285,16 +331,20 @@ class FlowField(BaseClass):
             # Compute the 3-dimensional interpolants for each wind direction
             # Linear interpolation is used for points within the user-defined area of values,
             # while the freestream wind speed is used for points outside that region
+            # The triangulation of the points is shared by all wind directions
+            triangulation = Delaunay(list(zip(x, y, z)))
             in_region = [
-                LinearNDInterpolator(list(zip(x, y, z)), multiplier, fill_value=1.0)
+                LinearNDInterpolator(triangulation, multiplier, fill_value=1.0)
                 for multiplier in speed_multipliers
             ]
         else:
             # Compute the 2-dimensional interpolants for each wind direction
             # Linear interpolation is used for points within the user-defined area of values,
             # while the freestream wind speed is used for points outside that region
+            # The triangulation of the points is shared by all wind directions
+            triangulation = Delaunay(list(zip(x, y)))
             in_region = [
-                LinearNDInterpolator(list(zip(x, y)), multiplier, fill_value=1.0)
+                LinearNDInterpolator(triangulation, multiplier, fill_value=1.0)
                 for multiplier in speed_multipliers
             ]
 
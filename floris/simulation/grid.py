@@ -65,6 +65,9 @@ class Grid(ABC):
         wind_speeds (:py:obj:`NDArrayFloat`): Wind speeds supplied by the user.
         time_series (:py:obj:`bool`): Flag to indicate whether the supplied wind data is a time
             series.
+        turbine_coordinates_array (:py:obj:`NDArrayFloat`, optional): The turbine coordinates
+            as an array with shape (number of turbines, 3), such as `Farm.coordinates_array`. If
+            not given, it is built from `turbine_coordinates`. Defaults to None.
     """
     turbine_coordinates: list[Vec3] = field()
     reference_turbine_diameter: float
@@ -76,7 +79,7 @@ class Grid(ABC):
     n_turbines: int = field(init=False)
     n_wind_speeds: int = field(init=False)
     n_wind_directions: int = field(init=False)
-    turbine_coordinates_array: NDArrayFloat = field(init=False)
+    turbine_coordinates_array: NDArrayFloat = field(default=None, kw_only=True)
     x_sorted: NDArrayFloat = field(init=False)
     y_sorted: NDArrayFloat = field(init=False)
     z_sorted: NDArrayFloat = field(init=False)
@@ -86,7 +89,10 @@ class Grid(ABC):
     cubature_weights: NDArrayFloat = field(init=False, default=None)
 
     def __attrs_post_init__(self) -> None:
-        self.turbine_coordinates_array = np.array([c.elements for c in self.turbine_coordinates])
+        if self.turbine_coordinates_array is None:
+            self.turbine_coordinates_array = np.array(
+                [c.elements for c in self.turbine_coordinates]
+            )
 
     @turbine_coordinates.validator
     def check_coordinates(self, instance: attrs.Attribute, value: list[Vec3]) -> None:
@@ -243,7 +249,7 @@ class TurbineGrid(Grid):
         # np.linspace would just return the starting value of -1 * disc_area_radius
         # which would place the point below the center of the rotor.
         if self.grid_resolution == 1:
-            disc_grid = np.zeros((np.shape(disc_area_radius)[0], 1 ))
+            disc_grid = np.zeros((np.shape(disc_area_radius)[0], 1 ), dtype=floris_float_type)
         else:
             disc_grid = np.linspace(
                 -1 * disc_area_radius,
@@ -268,9 +274,17 @@ class TurbineGrid(Grid):
         # Get the sorted indices for the x coordinates. These are the indices
         # to sort the turbines from upstream to downstream for all wind directions.
         # Also, store the indices to sort them back for when the calculation finishes.
-        self.sorted_indices = _x.argsort(axis=2)
+        # Since all points on a turbine's grid share the turbine's x coordinate, the
+        # turbine coordinates are sorted once and the indices are broadcast to the grid.
         self.sorted_coord_indices = x.argsort(axis=2)
-        self.unsorted_indices = self.sorted_indices.argsort(axis=2)
+        self.sorted_indices = np.broadcast_to(
+            self.sorted_coord_indices[:, :, :, None, None],
+            _x.shape
+        )
+        self.unsorted_indices = np.broadcast_to(
+            self.sorted_coord_indices.argsort(axis=2)[:, :, :, None, None],
+            _x.shape
+        )
 
         # Put the turbine coordinates into the final arrays in their sorted order
         # These are the coordinates that should be used within the internal calculations
@@ -367,9 +381,17 @@ class TurbineCubatureGrid(Grid):
         # Get the sorted indices for the x coordinates. These are the indices
         # to sort the turbines from upstream to downstream for all wind directions.
         # Also, store the indices to sort them back for when the calculation finishes.
-        self.sorted_indices = _x.argsort(axis=2)
+        # Since all points on a turbine's grid share the turbine's x coordinate, the
+        # turbine coordinates are sorted once and the indices are broadcast to the grid.
         self.sorted_coord_indices = x.argsort(axis=2)
-        self.unsorted_indices = self.sorted_indices.argsort(axis=2)
+        self.sorted_indices = np.broadcast_to(
+            self.sorted_coord_indices[:, :, :, None, None],
+            _x.shape
+        )
+        self.unsorted_indices = np.broadcast_to(
+            self.sorted_coord_indices.argsort(axis=2)[:, :, :, None, None],
+            _x.shape
+        )
 
         # Put the turbine coordinates into the final arrays in their sorted order
         # These are the coordinates that should be used within the internal calculations
@@ -509,9 +531,9 @@ class FlowFieldGrid(Grid):
         zmax = 6 * max(z[0,0])
 
         x_points, y_points, z_points = np.meshgrid(
-            np.linspace(xmin, xmax, int(self.grid_resolution[0])),
-            np.linspace(ymin, ymax, int(self.grid_resolution[1])),
-            np.linspace(zmin, zmax, int(self.grid_resolution[2])),
+            np.linspace(xmin, xmax, int(self.grid_resolution[0]), dtype=floris_float_type),
+            np.linspace(ymin, ymax, int(self.grid_resolution[1]), dtype=floris_float_type),
+            np.linspace(zmin, zmax, int(self.grid_resolution[2]), dtype=floris_float_type),
             indexing="ij"
         )
 
@@ -633,6 +655,11 @@ class FlowFieldPlanarGrid(Grid):
             self.y_sorted = y_points[None, None, :, :, :]
             self.z_sorted = z_points[None, None, :, :, :]
 
+        # Store the planar grid with the same floating point type as the other grids
+        self.x_sorted = self.x_sorted.astype(floris_float_type, copy=False)
+        self.y_sorted = self.y_sorted.astype(floris_float_type, copy=False)
+        self.z_sorted = self.z_sorted.astype(floris_float_type, copy=False)
+
         # Now calculate grid coordinates in original frame (from 270 deg perspective)
         self.x_sorted_inertial_frame, self.y_sorted_inertial_frame, self.z_sorted_inertial_frame = \
             reverse_rotate_coordinates_rel_west(
@@ -682,7 +709,9 @@ class PointsGrid(Grid):
         """
         Set points for calculation based on a series of user-supplied coordinates.
         """
-        point_coordinates = np.array(list(zip(self.points_x, self.points_y, self.points_z)))
+        point_coordinates = np.column_stack(
+            (self.points_x, self.points_y, self.points_z)
+        ).astype(floris_float_type, copy=False)
 
         # These are the rotated coordinates of the wind turbines based on the wind direction
         x, y, z, _, _ = rotate_coordinates_rel_west(
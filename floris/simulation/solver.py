@@ -59,6 +59,36 @@ def calculate_area_overlap(wake_velocities, freestream_velocities, y_ngrid, z_ng
     return np.sum(freestream_velocities - wake_velocities > 0.05, axis=(3, 4)) / (y_ngrid * z_ngrid)
 
 
+def calculate_area_overlap_from_deficit(
+    velocity_deficit,
+    freestream_velocities,
+    y_ngrid,
+    z_ngrid,
+):
+    """
+    Compute the wake overlap as in calculate_area_overlap(), but from the fractional velocity
+    deficit of a single wake rather than from the wake velocities.
+
+    Args:
+        velocity_deficit (NDArrayFloat): The fractional velocity deficit of the wake on each
+            rotor grid point, so that the wake velocity is
+            freestream_velocities * (1 - velocity_deficit).
+        freestream_velocities (NDArrayFloat): The freestream velocities on each rotor grid point.
+        y_ngrid (int): The grid resolution of the rotor grid in the y-direction.
+        z_ngrid (int): The grid resolution of the rotor grid in the z-direction.
+
+    Returns:
+        NDArrayFloat: The fraction of the rotor grid points of each turbine that are in the wake.
+    """
+    # Find the points on the rotor grids with a difference from freestream of greater
+    # than some tolerance. These are all the points in the wake. The ratio of
+    # these points to the total points is the portion of wake overlap.
+    return (
+        np.sum(velocity_deficit * freestream_velocities > 0.05, axis=(3, 4))
+        / (y_ngrid * z_ngrid)
+    )
+
+
 # @profile
 def sequential_solver(
     farm: Farm,
@@ -81,22 +111,29 @@ def sequential_solver(
     v_wake = np.zeros_like(flow_field.v_initial_sorted)
     w_wake = np.zeros_like(flow_field.w_initial_sorted)
 
-    turbine_turbulence_intensity = (
-        flow_field.turbulence_intensity
-        * np.ones((flow_field.n_wind_directions, flow_field.n_wind_speeds, farm.n_turbines, 1, 1))
+    turbine_turbulence_intensity = np.full(
+        (flow_field.n_wind_directions, flow_field.n_wind_speeds, farm.n_turbines, 1, 1),
+        flow_field.turbulence_intensity,
     )
     ambient_turbulence_intensity = flow_field.turbulence_intensity
 
+    # Get the center of each turbine's rotor once for all turbines; these are
+    # sliced for the current turbine in the loop below
+    x_coord = np.mean(grid.x_sorted, axis=(3, 4))[:, :, :, None, None]
+    y_coord = np.mean(grid.y_sorted, axis=(3, 4))[:, :, :, None, None]
+    z_coord = np.mean(grid.z_sorted, axis=(3, 4))[:, :, :, None, None]
+
+    # The wake-added turbulence of each turbine is applied up to 15 rotor diameters
+    # downstream, so find the end of that region for all turbines at once
+    downstream_influence_end = x_coord + 15 * farm.rotor_diameters_sorted[:, :, :, None, None]
+
     # Calculate the velocity deficit sequentially from upstream to downstream turbines
     for i in range(grid.n_turbines):
 
         # Get the current turbine quantities
-        x_i = np.mean(grid.x_sorted[:, :, i:i+1], axis=(3, 4))
-        x_i = x_i[:, :, :, None, None]
-        y_i = np.mean(grid.y_sorted[:, :, i:i+1], axis=(3, 4))
-        y_i = y_i[:, :, :, None, None]
-        z_i = np.mean(grid.z_sorted[:, :, i:i+1], axis=(3, 4))
-        z_i = z_i[:, :, :, None, None]
+        x_i = x_coord[:, :, i:i+1]
+        y_i = y_coord[:, :, i:i+1]
+        z_i = z_coord[:, :, i:i+1]
 
         u_i = flow_field.u_sorted[:, :, i:i+1]
         v_i = flow_field.v_sorted[:, :, i:i+1]
@@ -216,7 +253,8 @@ def sequential_solver(
 
         wake_field = model_manager.combination_model.function(
             wake_field,
-            velocity_deficit * flow_field.u_initial_sorted
+            velocity_deficit * flow_field.u_initial_sorted,
+            out=wake_field,
         )
 
         wake_added_turbulence_intensity = model_manager.turbulence_model.function(
@@ -228,31 +266,41 @@ def sequential_solver(
         )
 
         # Calculate wake overlap for wake-added turbulence (WAT)
-        area_overlap = (
-            np.sum(velocity_deficit * flow_field.u_initial_sorted > 0.05, axis=(3, 4))
-            / (grid.grid_resolution * grid.grid_resolution)
+        area_overlap = calculate_area_overlap_from_deficit(
+            velocity_deficit,
+            flow_field.u_initial_sorted,
+            grid.grid_resolution,
+            grid.grid_resolution,
         )
         area_overlap = area_overlap[:, :, :, None, None]
 
+        # Find the points that are within the region influenced by the current turbine's
+        # wake-added turbulence as a single mask rather than applying each test separately
+        in_influence_region = (
+            (grid.x_sorted > x_i)
+            & (np.abs(y_i - grid.y_sorted) < 2 * rotor_diameter_i)
+            & (grid.x_sorted <= downstream_influence_end[:, :, i:i+1])
+        )
+
         # Modify wake added turbulence by wake area overlap
-        downstream_influence_length = 15 * rotor_diameter_i
         ti_added = (
             area_overlap
             * np.nan_to_num(wake_added_turbulence_intensity, posinf=0.0)
-            * (grid.x_sorted > x_i)
-            * (np.abs(y_i - grid.y_sorted) < 2 * rotor_diameter_i)
-            * (grid.x_sorted <= downstream_influence_length + x_i)
+            * in_influence_region
         )
 
-        # Combine turbine TIs with WAT
+        # Combine turbine TIs with WAT, reusing the ti_added array for the result
+        np.hypot(ti_added, ambient_turbulence_intensity, out=ti_added)
         turbine_turbulence_intensity = np.maximum(
-            np.sqrt( ti_added ** 2 + ambient_turbulence_intensity ** 2 ),
-            turbine_turbulence_intensity
+            ti_added,
+            turbine_turbulence_intensity,
+            out=ti_added,
         )
 
-        flow_field.u_sorted = flow_field.u_initial_sorted - wake_field
-        flow_field.v_sorted += v_wake
-        flow_field.w_sorted += w_wake
+        np.subtract(flow_field.u_initial_sorted, wake_field, out=flow_field.u_sorted)
+        if model_manager.enable_transverse_velocities:
+            flow_field.v_sorted += v_wake
+            flow_field.w_sorted += w_wake
 
     flow_field.turbulence_intensity_field_sorted = turbine_turbulence_intensity
     flow_field.turbulence_intensity_field_sorted_avg = np.mean(
@@ -289,6 +337,7 @@ def full_flow_sequential_solver(
 
     turbine_grid = TurbineGrid(
         turbine_coordinates=turbine_grid_farm.coordinates,
+        turbine_coordinates_array=turbine_grid_farm.coordinates_array,
         reference_turbine_diameter=turbine_grid_farm.rotor_diameters,
         wind_directions=turbine_grid_flow_field.wind_directions,
         wind_speeds=turbine_grid_flow_field.wind_speeds,
@@ -320,16 +369,19 @@ def full_flow_sequential_solver(
     v_wake = np.zeros_like(flow_field.v_initial_sorted)
     w_wake = np.zeros_like(flow_field.w_initial_sorted)
 
+    # Get the center of each turbine's rotor once for all turbines; these are
+    # sliced for the current turbine in the loop below
+    x_coord = np.mean(turbine_grid.x_sorted, axis=(3, 4))[:, :, :, None, None]
+    y_coord = np.mean(turbine_grid.y_sorted, axis=(3, 4))[:, :, :, None, None]
+    z_coord = np.mean(turbine_grid.z_sorted, axis=(3, 4))[:, :, :, None, None]
+
     # Calculate the velocity deficit sequentially from upstream to downstream turbines
     for i in range(flow_field_grid.n_turbines):
 
         # Get the current turbine quantities
-        x_i = np.mean(turbine_grid.x_sorted[:, :, i:i+1], axis=(3, 4))
-        x_i = x_i[:, :, :, None, None]
-        y_i = np.mean(turbine_grid.y_sorted[:, :, i:i+1], axis=(3, 4))
-        y_i = y_i[:, :, :, None, None]
-        z_i = np.mean(turbine_grid.z_sorted[:, :, i:i+1], axis=(3, 4))
-        z_i = z_i[:, :, :, None, None]
+        x_i = x_coord[:, :, i:i+1]
+        y_i = y_coord[:, :, i:i+1]
+        z_i = z_coord[:, :, i:i+1]
 
         u_i = turbine_grid_flow_field.u_sorted[:, :, i:i+1]
         v_i = turbine_grid_flow_field.v_sorted[:, :, i:i+1]
@@ -434,12 +486,14 @@ def full_flow_sequential_solver(
 
         wake_field = model_manager.combination_model.function(
             wake_field,
-            velocity_deficit * flow_field.u_initial_sorted
+            velocity_deficit * flow_field.u_initial_sorted,
+            out=wake_field,
         )
 
-        flow_field.u_sorted = flow_field.u_initial_sorted - wake_field
-        flow_field.v_sorted += v_wake
-        flow_field.w_sorted += w_wake
+        np.subtract(flow_field.u_initial_sorted, wake_field, out=flow_field.u_sorted)
+        if model_manager.enable_transverse_velocities:
+            flow_field.v_sorted += v_wake
+            flow_field.w_sorted += w_wake
 
 
 def cc_solver(
@@ -458,9 +512,9 @@ def cc_solver(
     turb_u_wake = np.zeros_like(flow_field.u_initial_sorted)
     turb_inflow_field = copy.deepcopy(flow_field.u_initial_sorted)
 
-    turbine_turbulence_intensity = (
-        flow_field.turbulence_intensity
-        * np.ones((flow_field.n_wind_directions, flow_field.n_wind_speeds, farm.n_turbines, 1, 1))
+    turbine_turbulence_intensity = np.full(
+        (flow_field.n_wind_directions, flow_field.n_wind_speeds, farm.n_turbines, 1, 1),
+        flow_field.turbulence_intensity,
     )
     ambient_turbulence_intensity = flow_field.turbulence_intensity
 
@@ -471,16 +525,23 @@ def cc_solver(
     # sigma_i = np.zeros((shape))
     # sigma_i = np.zeros((len(x_coord), len(wd), len(ws), len(x_coord), y_ngrid, z_ngrid))
 
+    # Get the center of each turbine's rotor once for all turbines; these are
+    # sliced for the current turbine in the loop below
+    x_coord = np.mean(grid.x_sorted, axis=(3, 4))[:, :, :, None, None]
+    y_coord = np.mean(grid.y_sorted, axis=(3, 4))[:, :, :, None, None]
+    z_coord = np.mean(grid.z_sorted, axis=(3, 4))[:, :, :, None, None]
+
+    # The wake-added turbulence of each turbine is applied up to 15 rotor diameters
+    # downstream, so find the end of that region for all turbines at once
+    downstream_influence_end = x_coord + 15 * farm.rotor_diameters_sorted[:, :, :, None, None]
+
     # Calculate the velocity deficit sequentially from upstream to downstream turbines
     for i in range(grid.n_turbines):
 
         # Get the current turbine quantities
-        x_i = np.mean(grid.x_sorted[:, :, i:i+1], axis=(3, 4))
-        x_i = x_i[:, :, :, None, None]
-        y_i = np.mean(grid.y_sorted[:, :, i:i+1], axis=(3, 4))
-        y_i = y_i[:, :, :, None, None]
-        z_i = np.mean(grid.z_sorted[:, :, i:i+1], axis=(3, 4))
-        z_i = z_i[:, :, :, None, None]
+        x_i = x_coord[:, :, i:i+1]
+        y_i = y_coord[:, :, i:i+1]
+        z_i = z_coord[:, :, i:i+1]
 
         rotor_diameter_i = farm.rotor_diameters_sorted[: ,:, i:i+1, None, None]
 
@@ -641,24 +702,32 @@ def cc_solver(
         )
         area_overlap = area_overlap[:, :, :, None, None]
 
+        # Find the points that are within the region influenced by the current turbine's
+        # wake-added turbulence as a single mask rather than applying each test separately
+        in_influence_region = (
+            (grid.x_sorted > x_i)
+            & (np.abs(y_i - grid.y_sorted) < 2 * rotor_diameter_i)
+            & (grid.x_sorted <= downstream_influence_end[:, :, i:i+1])
+        )
+
         # Modify wake added turbulence by wake area overlap
-        downstream_influence_length = 15 * rotor_diameter_i
         ti_added = (
             area_overlap
             * np.nan_to_num(wake_added_turbulence_intensity, posinf=0.0)
-            * (grid.x_sorted > x_i)
-            * (np.abs(y_i - grid.y_sorted) < 2 * rotor_diameter_i)
-            * (grid.x_sorted <= downstream_influence_length + x_i)
+            * in_influence_region
         )
 
-        # Combine turbine TIs with WAT
+        # Combine turbine TIs with WAT, reusing the ti_added array for the result
+        np.hypot(ti_added, ambient_turbulence_intensity, out=ti_added)
         turbine_turbulence_intensity = np.maximum(
-            np.sqrt(ti_added ** 2 + ambient_turbulence_intensity ** 2),
-            turbine_turbulence_intensity
+            ti_added,
+            turbine_turbulence_intensity,
+            out=ti_added,
         )
 
-        flow_field.v_sorted += v_wake
-        flow_field.w_sorted += w_wake
+        if model_manager.enable_transverse_velocities:
+            flow_field.v_sorted += v_wake
+            flow_field.w_sorted += w_wake
     flow_field.u_sorted = turb_inflow_field
 
     flow_field.turbulence_intensity_field_sorted = turbine_turbulence_intensity
@@ -695,6 +764,7 @@ def full_flow_cc_solver(
 
     turbine_grid = TurbineGrid(
         turbine_coordinates=turbine_grid_farm.coordinates,
+        turbine_coordinates_array=turbine_grid_farm.coordinates_array,
         reference_turbine_diameter=turbine_grid_farm.rotor_diameters,
         wind_directions=turbine_grid_flow_field.wind_directions,
         wind_speeds=turbine_grid_flow_field.wind_speeds,
@@ -729,16 +799,19 @@ def full_flow_cc_solver(
     shape = (farm.n_turbines,) + np.shape(flow_field.u_initial_sorted)
     Ctmp = np.zeros((shape))
 
+    # Get the center of each turbine's rotor once for all turbines; these are
+    # sliced for the current turbine in the loop below
+    x_coord = np.mean(turbine_grid.x_sorted, axis=(3, 4))[:, :, :, None, None]
+    y_coord = np.mean(turbine_grid.y_sorted, axis=(3, 4))[:, :, :, None, None]
+    z_coord = np.mean(turbine_grid.z_sorted, axis=(3, 4))[:, :, :, None, None]
+
     # Calculate the velocity deficit sequentially from upstream to downstream turbines
     for i in range(flow_field_grid.n_turbines):
 
         # Get the current turbine quantities
-        x_i = np.mean(turbine_grid.x_sorted[:, :, i:i+1], axis=(3, 4))
-        x_i = x_i[:, :, :, None, None]
-        y_i = np.mean(turbine_grid.y_sorted[:, :, i:i+1], axis=(3, 4))
-        y_i = y_i[:, :, :, None, None]
-        z_i = np.mean(turbine_grid.z_sorted[:, :, i:i+1], axis=(3, 4))
-        z_i = z_i[:, :, :, None, None]
+        x_i = x_coord[:, :, i:i+1]
+        y_i = y_coord[:, :, i:i+1]
+        z_i = z_coord[:, :, i:i+1]
 
         u_i = turbine_grid_flow_field.u_sorted[:, :, i:i+1]
         v_i = turbine_grid_flow_field.v_sorted[:, :, i:i+1]
@@ -847,9 +920,10 @@ def full_flow_cc_solver(
             **deficit_model_args,
         )
 
-        flow_field.v_sorted += v_wake
-        flow_field.w_sorted += w_wake
-    flow_field.u_sorted = flow_field.u_initial_sorted - turb_u_wake
+        if model_manager.enable_transverse_velocities:
+            flow_field.v_sorted += v_wake
+            flow_field.w_sorted += w_wake
+    np.subtract(flow_field.u_initial_sorted, turb_u_wake, out=flow_field.u_sorted)
 
 
 def turbopark_solver(
@@ -876,21 +950,38 @@ def turbopark_solver(
     velocity_deficit = np.zeros(shape)
     deflection_field = np.zeros_like(flow_field.u_initial_sorted)
 
-    turbine_turbulence_intensity = (
-        flow_field.turbulence_intensity
-        * np.ones((flow_field.n_wind_directions, flow_field.n_wind_speeds, farm.n_turbines, 1, 1))
+    turbine_turbulence_intensity = np.full(
+        (flow_field.n_wind_directions, flow_field.n_wind_speeds, farm.n_turbines, 1, 1),
+        flow_field.turbulence_intensity,
     )
     ambient_turbulence_intensity = flow_field.turbulence_intensity
 
+    # Get the center of each turbine's rotor once for all turbines; these are
+    # sliced for the current turbine in the loop below
+    x_coord = np.mean(grid.x_sorted, axis=(3, 4))[:, :, :, None, None]
+    y_coord = np.mean(grid.y_sorted, axis=(3, 4))[:, :, :, None, None]
+    z_coord = np.mean(grid.z_sorted, axis=(3, 4))[:, :, :, None, None]
+
+    # The wake-added turbulence of each turbine is applied up to 15 rotor diameters
+    # downstream, so find the end of that region for all turbines at once
+    downstream_influence_end = x_coord + 15 * farm.rotor_diameters_sorted[:, :, :, None, None]
+
+    # The yaw angles do not change within the turbine loop, so check once here whether
+    # the deflection field needs to be calculated
+    calculate_deflection = not np.all(farm.yaw_angles_sorted)
+    if calculate_deflection:
+        model_manager.deflection_model.logger.warning(
+            "WARNING: Deflection with the TurbOPark model has not been fully validated."
+            "This is an initial implementation, and we advise you use at your own risk"
+            "and perform a thorough examination of the results."
+        )
+
     # Calculate the velocity deficit sequentially from upstream to downstream turbines
     for i in range(grid.n_turbines):
         # Get the current turbine quantities
-        x_i = np.mean(grid.x_sorted[:, :, i:i+1], axis=(3, 4))
-        x_i = x_i[:, :, :, None, None]
-        y_i = np.mean(grid.y_sorted[:, :, i:i+1], axis=(3, 4))
-        y_i = y_i[:, :, :, None, None]
-        z_i = np.mean(grid.z_sorted[:, :, i:i+1], axis=(3, 4))
-        z_i = z_i[:, :, :, None, None]
+        x_i = x_coord[:, :, i:i+1]
+        y_i = y_coord[:, :, i:i+1]
+        z_i = z_coord[:, :, i:i+1]
 
         u_i = flow_field.u_sorted[:, :, i:i+1]
         v_i = flow_field.v_sorted[:, :, i:i+1]
@@ -967,17 +1058,10 @@ def turbopark_solver(
 
         # Model calculations
         # NOTE: exponential
-        if not np.all(farm.yaw_angles_sorted):
-            model_manager.deflection_model.logger.warning(
-                "WARNING: Deflection with the TurbOPark model has not been fully validated."
-                "This is an initial implementation, and we advise you use at your own risk"
-                "and perform a thorough examination of the results."
-            )
+        if calculate_deflection:
             for ii in range(i):
-                x_ii = np.mean(grid.x_sorted[:, :, ii:ii+1], axis=(3, 4))
-                x_ii = x_ii[:, :, :, None, None]
-                y_ii = np.mean(grid.y_sorted[:, :, ii:ii+1], axis=(3, 4))
-                y_ii = y_ii[:, :, :, None, None]
+                x_ii = x_coord[:, :, ii:ii+1]
+                y_ii = y_coord[:, :, ii:ii+1]
 
                 yaw_ii = farm.yaw_angles_sorted[:, :, ii:ii+1, None, None]
                 turbulence_intensity_ii = turbine_turbulence_intensity[:, :, ii:ii+1]
@@ -1054,7 +1138,8 @@ def turbopark_solver(
 
         wake_field = model_manager.combination_model.function(
             wake_field,
-            velocity_deficit * flow_field.u_initial_sorted
+            velocity_deficit * flow_field.u_initial_sorted,
+            out=wake_field,
         )
 
         wake_added_turbulence_intensity = model_manager.turbulence_model.function(
@@ -1069,31 +1154,41 @@ def turbopark_solver(
         # compute area_overlap as the current wake deficit is solved for only upstream
         # turbines; could use WAT_upstream
         # Calculate wake overlap for wake-added turbulence (WAT)
-        area_overlap = (
-            np.sum(velocity_deficit * flow_field.u_initial_sorted > 0.05, axis=(3, 4))
-            / (grid.grid_resolution * grid.grid_resolution)
+        area_overlap = calculate_area_overlap_from_deficit(
+            velocity_deficit,
+            flow_field.u_initial_sorted,
+            grid.grid_resolution,
+            grid.grid_resolution,
         )
         area_overlap = area_overlap[:, :, :, None, None]
 
+        # Find the points that are within the region influenced by the current turbine's
+        # wake-added turbulence as a single mask rather than applying each test separately
+        in_influence_region = (
+            (grid.x_sorted > x_i)
+            & (np.abs(y_i - grid.y_sorted) < 2 * rotor_diameter_i)
+            & (grid.x_sorted <= downstream_influence_end[:, :, i:i+1])
+        )
+
         # Modify wake added turbulence by wake area overlap
-        downstream_influence_length = 15 * rotor_diameter_i
         ti_added = (
             area_overlap
             * np.nan_to_num(wake_added_turbulence_intensity, posinf=0.0)
-            * (grid.x_sorted > x_i)
-            * (np.abs(y_i - grid.y_sorted) < 2 * rotor_diameter_i)
-            * (grid.x_sorted <= downstream_influence_length + x_i)
+            * in_influence_region
         )
 
-        # Combine turbine TIs with WAT
+        # Combine turbine TIs with WAT, reusing the ti_added array for the result
+        np.hypot(ti_added, ambient_turbulence_intensity, out=ti_added)
         turbine_turbulence_intensity = np.maximum(
-            np.sqrt( ti_added ** 2 + ambient_turbulence_intensity ** 2 ),
-            turbine_turbulence_intensity
+            ti_added,
+            turbine_turbulence_intensity,
+            out=ti_added,
         )
 
-        flow_field.u_sorted = flow_field.u_initial_sorted - wake_field
-        flow_field.v_sorted += v_wake
-        flow_field.w_sorted += w_wake
+        np.subtract(flow_field.u_initial_sorted, wake_field, out=flow_field.u_sorted)
+        if model_manager.enable_transverse_velocities:
+            flow_field.v_sorted += v_wake
+            flow_field.w_sorted += w_wake
 
     flow_field.turbulence_intensity_field_sorted = turbine_turbulence_intensity
     flow_field.turbulence_intensity_field_sorted_avg = np.mean(
@@ -1188,8 +1283,6 @@ def empirical_gauss_solver(
 
     # This is u_wake
     wake_field = np.zeros_like(flow_field.u_initial_sorted)
-    v_wake = np.zeros_like(flow_field.v_initial_sorted)
-    w_wake = np.zeros_like(flow_field.w_initial_sorted)
 
     x_locs = np.mean(grid.x_sorted, axis=(3, 4))[:,:,:,None]
     downstream_distance_D = x_locs - np.transpose(x_locs, axes=(0,1,3,2))
@@ -1200,16 +1293,19 @@ def empirical_gauss_solver(
     mixing_factor[:,:,:,:] = model_manager.turbulence_model.atmospheric_ti_gain*\
         flow_field.turbulence_intensity*np.eye(grid.n_turbines)
 
+    # Get the center of each turbine's rotor once for all turbines; these are
+    # sliced for the current turbine in the loop below
+    x_coord = x_locs[:, :, :, :, None]
+    y_coord = np.mean(grid.y_sorted, axis=(3, 4))[:, :, :, None, None]
+    z_coord = np.mean(grid.z_sorted, axis=(3, 4))[:, :, :, None, None]
+
     # Calculate the velocity deficit sequentially from upstream to downstream turbines
     for i in range(grid.n_turbines):
 
         # Get the current turbine quantities
-        x_i = np.mean(grid.x_sorted[:, :, i:i+1], axis=(3, 4))
-        x_i = x_i[:, :, :, None, None]
-        y_i = np.mean(grid.y_sorted[:, :, i:i+1], axis=(3, 4))
-        y_i = y_i[:, :, :, None, None]
-        z_i = np.mean(grid.z_sorted[:, :, i:i+1], axis=(3, 4))
-        z_i = z_i[:, :, :, None, None]
+        x_i = x_coord[:, :, i:i+1]
+        y_i = y_coord[:, :, i:i+1]
+        z_i = z_coord[:, :, i:i+1]
 
         flow_field.u_sorted[:, :, i:i+1]
         flow_field.v_sorted[:, :, i:i+1]
@@ -1317,12 +1413,17 @@ def empirical_gauss_solver(
 
         wake_field = model_manager.combination_model.function(
             wake_field,
-            velocity_deficit * flow_field.u_initial_sorted
+            velocity_deficit * flow_field.u_initial_sorted,
+            out=wake_field,
         )
 
         # Calculate wake overlap for wake-added turbulence (WAT)
-        area_overlap = np.sum(velocity_deficit * flow_field.u_initial_sorted > 0.05, axis=(3, 4))\
-            / (grid.grid_resolution * grid.grid_resolution)
+        area_overlap = calculate_area_overlap_from_deficit(
+            velocity_deficit,
+            flow_field.u_initial_sorted,
+            grid.grid_resolution,
+            grid.grid_resolution,
+        )
 
         # Compute wake induced mixing factor
         mixing_factor[:,:,:,i] += \
@@ -1338,9 +1439,7 @@ def empirical_gauss_solver(
                 model_manager.deflection_model.yaw_added_mixing_gain
             )
 
-        flow_field.u_sorted = flow_field.u_initial_sorted - wake_field
-        flow_field.v_sorted += v_wake
-        flow_field.w_sorted += w_wake
+        np.subtract(flow_field.u_initial_sorted, wake_field, out=flow_field.u_sorted)
 
     return mixing_factor
 
@@ -1373,6 +1472,7 @@ def full_flow_empirical_gauss_solver(
 
     turbine_grid = TurbineGrid(
         turbine_coordinates=turbine_grid_farm.coordinates,
+        turbine_coordinates_array=turbine_grid_farm.coordinates_array,
         reference_turbine_diameter=turbine_grid_farm.rotor_diameters,
         wind_directions=turbine_grid_flow_field.wind_directions,
         wind_speeds=turbine_grid_flow_field.wind_speeds,
@@ -1402,19 +1502,20 @@ def full_flow_empirical_gauss_solver(
     deficit_model_args = model_manager.velocity_model.prepare_function(flow_field_grid, flow_field)
 
     wake_field = np.zeros_like(flow_field.u_initial_sorted)
-    v_wake = np.zeros_like(flow_field.v_initial_sorted)
-    w_wake = np.zeros_like(flow_field.w_initial_sorted)
+
+    # Get the center of each turbine's rotor once for all turbines; these are
+    # sliced for the current turbine in the loop below
+    x_coord = np.mean(turbine_grid.x_sorted, axis=(3, 4))[:, :, :, None, None]
+    y_coord = np.mean(turbine_grid.y_sorted, axis=(3, 4))[:, :, :, None, None]
+    z_coord = np.mean(turbine_grid.z_sorted, axis=(3, 4))[:, :, :, None, None]
 
     # Calculate the velocity deficit sequentially from upstream to downstream turbines
     for i in range(flow_field_grid.n_turbines):
 
         # Get the current turbine quantities
-        x_i = np.mean(turbine_grid.x_sorted[:, :, i:i+1], axis=(3, 4))
-        x_i = x_i[:, :, :, None, None]
-        y_i = np.mean(turbine_grid.y_sorted[:, :, i:i+1], axis=(3, 4))
-        y_i = y_i[:, :, :, None, None]
-        z_i = np.mean(turbine_grid.z_sorted[:, :, i:i+1], axis=(3, 4))
-        z_i = z_i[:, :, :, None, None]
+        x_i = x_coord[:, :, i:i+1]
+        y_i = y_coord[:, :, i:i+1]
+        z_i = z_coord[:, :, i:i+1]
 
         turbine_grid_flow_field.u_sorted[:, :, i:i+1]
         turbine_grid_flow_field.v_sorted[:, :, i:i+1]
@@ -1503,12 +1604,11 @@ def full_flow_empirical_gauss_solver(
 
         wake_field = model_manager.combination_model.function(
             wake_field,
-            velocity_deficit * flow_field.u_initial_sorted
+            velocity_deficit * flow_field.u_initial_sorted,
+            out=wake_field,
         )
 
-        flow_field.u_sorted = flow_field.u_initial_sorted - wake_field
-        flow_field.v_sorted += v_wake
-        flow_field.w_sorted += w_wake
+        np.subtract(flow_field.u_initial_sorted, wake_field, out=flow_field.u_sorted)
 
 
 def sequential_multidim_solver(
@@ -1536,22 +1636,29 @@ def sequential_multidim_solver(
     v_wake = np.zeros_like(flow_field.v_initial_sorted)
     w_wake = np.zeros_like(flow_field.w_initial_sorted)
 
-    turbine_turbulence_intensity = (
-        flow_field.turbulence_intensity
-        * np.ones((flow_field.n_wind_directions, flow_field.n_wind_speeds, farm.n_turbines, 1, 1))
+    turbine_turbulence_intensity = np.full(
+        (flow_field.n_wind_directions, flow_field.n_wind_speeds, farm.n_turbines, 1, 1),
+        flow_field.turbulence_intensity,
     )
     ambient_turbulence_intensity = flow_field.turbulence_intensity
 
+    # Get the center of each turbine's rotor once for all turbines; these are
+    # sliced for the current turbine in the loop below
+    x_coord = np.mean(grid.x_sorted, axis=(3, 4))[:, :, :, None, None]
+    y_coord = np.mean(grid.y_sorted, axis=(3, 4))[:, :, :, None, None]
+    z_coord = np.mean(grid.z_sorted, axis=(3, 4))[:, :, :, None, None]
+
+    # The wake-added turbulence of each turbine is applied up to 15 rotor diameters
+    # downstream, so find the end of that region for all turbines at once
+    downstream_influence_end = x_coord + 15 * farm.rotor_diameters_sorted[:, :, :, None, None]
+
     # Calculate the velocity deficit sequentially from upstream to downstream turbines
     for i in range(grid.n_turbines):
 
         # Get the current turbine quantities
-        x_i = np.mean(grid.x_sorted[:, :, i:i+1], axis=(3, 4))
-        x_i = x_i[:, :, :, None, None]
-        y_i = np.mean(grid.y_sorted[:, :, i:i+1], axis=(3, 4))
-        y_i = y_i[:, :, :, None, None]
-        z_i = np.mean(grid.z_sorted[:, :, i:i+1], axis=(3, 4))
-        z_i = z_i[:, :, :, None, None]
+        x_i = x_coord[:, :, i:i+1]
+        y_i = y_coord[:, :, i:i+1]
+        z_i = z_coord[:, :, i:i+1]
 
         u_i = flow_field.u_sorted[:, :, i:i+1]
         v_i = flow_field.v_sorted[:, :, i:i+1]
@@ -1671,7 +1778,8 @@ def sequential_multidim_solver(
 
         wake_field = model_manager.combination_model.function(
             wake_field,
-            velocity_deficit * flow_field.u_initial_sorted
+            velocity_deficit * flow_field.u_initial_sorted,
+            out=wake_field,
         )
 
         wake_added_turbulence_intensity = model_manager.turbulence_model.function(
@@ -1683,31 +1791,41 @@ def sequential_multidim_solver(
         )
 
         # Calculate wake overlap for wake-added turbulence (WAT)
-        area_overlap = (
-            np.sum(velocity_deficit * flow_field.u_initial_sorted > 0.05, axis=(3, 4))
-            / (grid.grid_resolution * grid.grid_resolution)
+        area_overlap = calculate_area_overlap_from_deficit(
+            velocity_deficit,
+            flow_field.u_initial_sorted,
+            grid.grid_resolution,
+            grid.grid_resolution,
         )
         area_overlap = area_overlap[:, :, :, None, None]
 
+        # Find the points that are within the region influenced by the current turbine's
+        # wake-added turbulence as a single mask rather than applying each test separately
+        in_influence_region = (
+            (grid.x_sorted > x_i)
+            & (np.abs(y_i - grid.y_sorted) < 2 * rotor_diameter_i)
+            & (grid.x_sorted <= downstream_influence_end[:, :, i:i+1])
+        )
+
         # Modify wake added turbulence by wake area overlap
-        downstream_influence_length = 15 * rotor_diameter_i
         ti_added = (
             area_overlap
             * np.nan_to_num(wake_added_turbulence_intensity, posinf=0.0)
-            * (grid.x_sorted > x_i)
-            * (np.abs(y_i - grid.y_sorted) < 2 * rotor_diameter_i)
-            * (grid.x_sorted <= downstream_influence_length + x_i)
+            * in_influence_region
         )
 
-        # Combine turbine TIs with WAT
+        # Combine turbine TIs with WAT, reusing the ti_added array for the result
+        np.hypot(ti_added, ambient_turbulence_intensity, out=ti_added)
         turbine_turbulence_intensity = np.maximum(
-            np.sqrt( ti_added ** 2 + ambient_turbulence_intensity ** 2 ),
-            turbine_turbulence_intensity
+            ti_added,
+            turbine_turbulence_intensity,
+            out=ti_added,
         )
 
-        flow_field.u_sorted = flow_field.u_initial_sorted - wake_field
-        flow_field.v_sorted += v_wake
-        flow_field.w_sorted += w_wake
+        np.subtract(flow_field.u_initial_sorted, wake_field, out=flow_field.u_sorted)
+        if model_manager.enable_transverse_velocities:
+            flow_field.v_sorted += v_wake
+            flow_field.w_sorted += w_wake
 
     flow_field.turbulence_intensity_field_sorted = turbine_turbulence_intensity
     flow_field.turbulence_intensity_field_sorted_avg = np.mean(
@@ -460,6 +460,16 @@ def cubic_cubature(array, cubature_weights, axis=0):
     weights = weights * len(weights) / np.sum(weights)
     return np.cbrt(np.mean((array**3.0 * weights[None, None, None, :, None]), axis=axis))
 
+# The rotor averaging functions keyed by method name so that the method is resolved with a
+# single lookup rather than a chain of string comparisons on every call
+AVERAGE_VELOCITY_METHODS = {
+    "simple-mean": simple_mean,
+    "cubic-mean": cubic_mean,
+    "simple-cubature": simple_cubature,
+    "cubic-cubature": cubic_cubature,
+}
+CUBATURE_METHODS = (simple_cubature, cubic_cubature)
+
 def average_velocity(
     velocities: NDArrayFloat,
     ix_filter: NDArrayFilter | Iterable[int] | None = None,
@@ -488,25 +498,17 @@ def average_velocity(
     if ix_filter is not None:
         velocities = velocities[:, :, ix_filter]
 
-    axis = tuple([3 + i for i in range(velocities.ndim - 3)])
-    if method == "simple-mean":
-        return simple_mean(velocities, axis)
-
-    elif method == "cubic-mean":
-        return cubic_mean(velocities, axis)
-
-    elif method == "simple-cubature":
-        if cubature_weights is None:
-            raise ValueError("cubature_weights is required for 'simple-cubature' method.")
-        return simple_cubature(velocities, cubature_weights, axis)
+    average_method = AVERAGE_VELOCITY_METHODS.get(method)
+    if average_method is None:
+        raise ValueError("Incorrect method given.")
 
-    elif method == "cubic-cubature":
+    axis = tuple([3 + i for i in range(velocities.ndim - 3)])
+    if average_method in CUBATURE_METHODS:
         if cubature_weights is None:
-            raise ValueError("cubature_weights is required for 'cubic-cubature' method.")
-        return cubic_cubature(velocities, cubature_weights, axis)
+            raise ValueError(f"cubature_weights is required for '{method}' method.")
+        return average_method(velocities, cubature_weights, axis)
 
-    else:
-        raise ValueError("Incorrect method given.")
+    return average_method(velocities, axis)
 
 @define
 class PowerThrustTable(FromDictMixin):
@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations under
 # the License.
 
+from __future__ import annotations
+
 import numpy as np
 from attrs import define
 
@@ -26,7 +28,12 @@ class FLS(BaseModel):
     def prepare_function(self) -> dict:
         pass
 
-    def function(self, wake_field: np.ndarray, velocity_field: np.ndarray):
+    def function(
+        self,
+        wake_field: np.ndarray,
+        velocity_field: np.ndarray,
+        out: np.ndarray | None = None,
+    ):
         """
         Combines the base flow field with the velocity deficits
         using freestream linear superpostion. In other words, the wake
@@ -35,9 +42,12 @@ class FLS(BaseModel):
         Args:
             u_field (np.array): The base flow field.
             u_wake (np.array): The wake to apply to the base flow field.
+            out (np.array, optional): Array to store the result in, e.g. the
+                wake field itself to combine in place. Defaults to None, which
+                allocates a new array.
 
         Returns:
             np.array: The resulting flow field after applying the wake to the
                 base.
         """
-        return wake_field + velocity_field
+        return np.add(wake_field, velocity_field, out=out)
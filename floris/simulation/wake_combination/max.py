@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations under
 # the License.
 
+from __future__ import annotations
+
 import numpy as np
 from attrs import define
 
@@ -33,7 +35,12 @@ class MAX(BaseModel):
     def prepare_function(self) -> dict:
         pass
 
-    def function(self, wake_field: np.ndarray, velocity_field: np.ndarray):
+    def function(
+        self,
+        wake_field: np.ndarray,
+        velocity_field: np.ndarray,
+        out: np.ndarray | None = None,
+    ):
         """
         Incorporates the velicty deficits into the base flow field by
         selecting the maximum of the two for each point.
@@ -41,9 +48,12 @@ class MAX(BaseModel):
         Args:
             u_field (np.array): The base flow field.
             u_wake (np.array): The wake to apply to the base flow field.
+            out (np.array, optional): Array to store the result in, e.g. the
+                wake field itself to combine in place. Defaults to None, which
+                allocates a new array.
 
         Returns:
             np.array: The resulting flow field after applying the wake to the
                 base.
         """
-        return np.maximum(wake_field, velocity_field)
+        return np.maximum(wake_field, velocity_field, out=out)
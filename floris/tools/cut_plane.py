@@ -18,7 +18,7 @@ import copy
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from scipy.interpolate import griddata
+from scipy.interpolate import CloughTocher2DInterpolator
 
 
 def nudge_outward(x):
@@ -190,32 +190,15 @@ def change_resolution(cut_plane, resolution=(100, 100)):
     x1_mesh, x2_mesh = np.meshgrid(x1_lin, x2_lin)
     x3_mesh = np.ones_like(x1_mesh) * cut_plane.df.x3[0]
 
-    # Interpolate u,v,w
-    u_mesh = griddata(
+    # Interpolate u,v,w with a single cubic interpolant so that the
+    # triangulation of the plane points is only computed once
+    interpolant = CloughTocher2DInterpolator(
         np.column_stack(
             [nudge_outward(cut_plane.df.x1), nudge_outward(cut_plane.df.x2)]
         ),
-        cut_plane.df.u.values,
-        (x1_mesh.flatten(), x2_mesh.flatten()),
-        method="cubic",
-    )
-    v_mesh = griddata(
-        np.column_stack(
-            [nudge_outward(cut_plane.df.x1), nudge_outward(cut_plane.df.x2)]
-        ),
-        cut_plane.df.v.values,
-        (x1_mesh.flatten(), x2_mesh.flatten()),
-        method="cubic",
-    )
-
-    w_mesh = griddata(
-        np.column_stack(
-            [nudge_outward(cut_plane.df.x1), nudge_outward(cut_plane.df.x2)]
-        ),
-        cut_plane.df.w.values,
-        (x1_mesh.flatten(), x2_mesh.flatten()),
-        method="cubic",
+        cut_plane.df[["u", "v", "w"]].values,
     )
+    u_mesh, v_mesh, w_mesh = interpolant(x1_mesh.flatten(), x2_mesh.flatten()).T
 
     # Assign back to df
     cut_plane.df = pd.DataFrame(
@@ -263,32 +246,15 @@ def interpolate_onto_array(cut_plane_in, x1_array, x2_array):
     x1_mesh, x2_mesh = np.meshgrid(x1_lin, x2_lin)
     x3_mesh = np.ones_like(x1_mesh) * cut_plane.df.x3.iloc[0]
 
-    # Interpolate u,v,w
-    u_mesh = griddata(
-        np.column_stack(
-            [nudge_outward(cut_plane.df.x1), nudge_outward(cut_plane.df.x2)]
-        ),
-        cut_plane.df.u.values,
-        (x1_mesh.flatten(), x2_mesh.flatten()),
-        method="cubic",
-    )
-    v_mesh = griddata(
-        np.column_stack(
-            [nudge_outward(cut_plane.df.x1), nudge_outward(cut_plane.df.x2)]
-        ),
-        cut_plane.df.v.values,
-        (x1_mesh.flatten(), x2_mesh.flatten()),
-        method="cubic",
-    )
-
-    w_mesh = griddata(
+    # Interpolate u,v,w with a single cubic interpolant so that the
+    # triangulation of the plane points is only computed once
+    interpolant = CloughTocher2DInterpolator(
         np.column_stack(
             [nudge_outward(cut_plane.df.x1), nudge_outward(cut_plane.df.x2)]
         ),
-        cut_plane.df.w.values,
-        (x1_mesh.flatten(), x2_mesh.flatten()),
-        method="cubic",
+        cut_plane.df[["u", "v", "w"]].values,
     )
+    u_mesh, v_mesh, w_mesh = interpolant(x1_mesh.flatten(), x2_mesh.flatten()).T
 
     # Assign back to df
     cut_plane.df = pd.DataFrame(
@@ -1018,7 +1018,7 @@ class FlorisInterface(LoggerBase):
             np.array: lists of x, y, and (optionally) z coordinates of
                 each turbine
         """
-        xcoords, ycoords, zcoords = np.array([c.elements for c in self.floris.farm.coordinates]).T
+        xcoords, ycoords, zcoords = self.floris.farm.coordinates_array.T.copy()
         if z:
             return xcoords, ycoords, zcoords
         else:
@@ -465,9 +465,14 @@ class YawOptimization(LoggerBase):
                 print("Wind direction array appears irregular.")
                 print("Exploitation of symmetry has been disabled.")
 
-            self._sym_mapping_extrap = np.array(
-                [np.where(np.abs(x - wd_array_min) < 0.0001)[0][0]
-                for x in wd_array_remn], dtype=int)
+            # Map each wind direction onto its first match in the minimal wind direction
+            # array, evaluated for all wind directions at once
+            is_match = np.abs(wd_array_remn[:, None] - wd_array_min[None, :]) < 0.0001
+            if not np.all(np.any(is_match, axis=1)):
+                raise IndexError(
+                    "No matching wind direction found in the minimal wind direction array."
+                )
+            self._sym_mapping_extrap = np.argmax(is_match, axis=1).astype(int)
 
             self._sym_mapping_reduce = copy.deepcopy(ids_minimal)
             self._sym_df = df
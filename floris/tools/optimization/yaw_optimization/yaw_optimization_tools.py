@@ -195,10 +195,18 @@ def find_layout_symmetry(x, y, step_sizes = [15.0], eps=0.00001):
                     + np.cos(ang * np.pi / 180.0) * y
                 )
                 wd_eval_array.append((wd_eval, wd_eval + wd))
-                id_mapping = ([
-                    np.where((np.abs(xr - x) < eps) &(np.abs(yr - y) < eps))[0][0]
-                    for xr, yr in zip(x_rot, y_rot)
-                ])
+
+                # Build the map from each rotated turbine to its matching original turbine
+                # for all turbines at once rather than searching the layout per turbine
+                is_match = (
+                    (np.abs(x_rot[:, None] - x[None, :]) < eps)
+                    & (np.abs(y_rot[:, None] - y[None, :]) < eps)
+                )
+                if not np.all(np.any(is_match, axis=1)):
+                    raise IndexError(
+                        f"No matching turbine found for the layout rotated by {wd_eval} deg."
+                    )
+                id_mapping = [int(ti) for ti in np.argmax(is_match, axis=1)]
                 mapping_array.append(id_mapping)
 
             df = pd.DataFrame({"wd_range": wd_eval_array, "turbine_mapping": mapping_array})
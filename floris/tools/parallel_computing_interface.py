@@ -1,6 +1,7 @@
 # Copyright 2022 Shell
 import copy
 import warnings
+from functools import partial
 from time import perf_counter as timerpc
 
 import numpy as np
@@ -28,10 +29,14 @@ def _load_local_floris_object(
     return fi
 
 
-def _get_turbine_powers_serial(fi_information, yaw_angles=None):
+def _get_turbine_powers_serial(fi_information, yaw_angles=None, propagate_flowfield=True):
     fi = _load_local_floris_object(*fi_information)
     fi.calculate_wake(yaw_angles=yaw_angles)
-    return (fi.get_turbine_powers(), fi.floris.flow_field)
+
+    # Only send the flow field back to the main process when it is requested since
+    # it is much larger than the turbine powers
+    flow_field = fi.floris.flow_field if propagate_flowfield else None
+    return (fi.get_turbine_powers(), flow_field)
 
 
 def _optimize_yaw_angles_serial(
@@ -329,12 +334,16 @@ class ParallelComputingInterface(LoggerBase):
 
         # Perform parallel calculation
         t1 = timerpc()
+        get_turbine_powers_serial = partial(
+            _get_turbine_powers_serial,
+            propagate_flowfield=self.propagate_flowfield_from_workers,
+        )
         with self._PoolExecutor(self.max_workers) as p:
             if (self.interface == "mpi4py") or (self.interface == "multiprocessing"):
-                out = p.starmap(_get_turbine_powers_serial, multiargs)
+                out = p.starmap(get_turbine_powers_serial, multiargs)
             else:
                 out = p.map(
-                    _get_turbine_powers_serial,
+                    get_turbine_powers_serial,
                     [j[0] for j in multiargs],
                     [j[1] for j in multiargs]
                 )
@@ -131,10 +131,9 @@ def add_turbine_id_labels(fi: FlorisInterface, ax: plt.Axes, **kwargs):
     """
 
     # Rotate layout to inertial frame for plotting turbines relative to wind direction
-    coordinates_array = np.array([
-        [x, y, 0.0]
-        for x, y in list(zip(fi.layout_x, fi.layout_y))
-    ])
+    coordinates_array = np.column_stack(
+        (fi.layout_x, fi.layout_y, np.zeros_like(fi.layout_x))
+    )
     wind_direction = fi.floris.flow_field.wind_directions[0]
     layout_x, layout_y, _, _, _ = rotate_coordinates_rel_west(
         np.array([wind_direction]),
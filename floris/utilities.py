@@ -253,16 +253,18 @@ def rotate_coordinates_rel_west(
         y_center_of_rotation = (np.min(y_coordinates) + np.max(y_coordinates)) / 2
 
     # Rotate turbine coordinates about the center
+    cos_wind_deviation = cosd(wind_deviation_from_west)
+    sin_wind_deviation = sind(wind_deviation_from_west)
     x_coord_offset = x_coordinates - x_center_of_rotation
     y_coord_offset = y_coordinates - y_center_of_rotation
     x_coord_rotated = (
-        x_coord_offset * cosd(wind_deviation_from_west)
-        - y_coord_offset * sind(wind_deviation_from_west)
+        x_coord_offset * cos_wind_deviation
+        - y_coord_offset * sin_wind_deviation
         + x_center_of_rotation
     )
     y_coord_rotated = (
-        x_coord_offset * sind(wind_deviation_from_west)
-        + y_coord_offset * cosd(wind_deviation_from_west)
+        x_coord_offset * sin_wind_deviation
+        + y_coord_offset * cos_wind_deviation
         + y_center_of_rotation
     )
     z_coord_rotated = np.ones_like(wind_deviation_from_west) * z_coordinates
@@ -298,33 +300,28 @@ def reverse_rotate_coordinates_rel_west(
     # We are rotating in the other direction
     wind_deviation_from_west = -1.0 * wind_delta(wind_directions)
 
-    # Construct the arrays storing the turbine locations
-    grid_x_reversed = np.zeros_like(grid_x)
-    grid_y_reversed = np.zeros_like(grid_x)
-    grid_z_reversed = np.zeros_like(grid_x)
-    for wii, angle_rotation in enumerate(wind_deviation_from_west):
-        x_rot = grid_x[wii, :, :, :, :]
-        y_rot = grid_y[wii, :, :, :, :]
-        z_rot = grid_z[wii, :, :, :, :]
-
-        # Rotate turbine coordinates about the center
-        x_rot_offset = x_rot - x_center_of_rotation
-        y_rot_offset = y_rot - y_center_of_rotation
-        x = (
-            x_rot_offset * cosd(angle_rotation)
-            - y_rot_offset * sind(angle_rotation)
-            + x_center_of_rotation
-        )
-        y = (
-            x_rot_offset * sind(angle_rotation)
-            + y_rot_offset * cosd(angle_rotation)
-            + y_center_of_rotation
-        )
-        z = z_rot  # Nothing changed in this rotation
-
-        grid_x_reversed[wii, :, :, :, :] = x
-        grid_y_reversed[wii, :, :, :, :] = y
-        grid_z_reversed[wii, :, :, :, :] = z
+    # Compute the rotation terms once for all wind directions and broadcast them
+    # over the remaining grid dimensions rather than looping over wind directions.
+    # The terms are cast to the grid's type so that the rotated grid keeps its precision.
+    cos_angle_rotation = cosd(wind_deviation_from_west)[:, None, None, None, None]
+    cos_angle_rotation = cos_angle_rotation.astype(grid_x.dtype, copy=False)
+    sin_angle_rotation = sind(wind_deviation_from_west)[:, None, None, None, None]
+    sin_angle_rotation = sin_angle_rotation.astype(grid_x.dtype, copy=False)
+
+    # Rotate grid coordinates about the center
+    grid_x_offset = grid_x - x_center_of_rotation
+    grid_y_offset = grid_y - y_center_of_rotation
+    grid_x_reversed = (
+        grid_x_offset * cos_angle_rotation
+        - grid_y_offset * sin_angle_rotation
+        + x_center_of_rotation
+    )
+    grid_y_reversed = (
+        grid_x_offset * sin_angle_rotation
+        + grid_y_offset * cos_angle_rotation
+        + y_center_of_rotation
+    )
+    grid_z_reversed = grid_z.copy()  # Nothing changed in this rotation
 
     return grid_x_reversed, grid_y_reversed, grid_z_reversed
 
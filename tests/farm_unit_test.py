@@ -54,6 +54,10 @@ def test_farm_init_homogenous_turbines():
 
     # Check initial values
     np.testing.assert_array_equal(farm.coordinates, coordinates)
+    np.testing.assert_array_equal(
+        farm.coordinates_array,
+        np.array([c.elements for c in coordinates])
+    )
     assert isinstance(farm.layout_x, np.ndarray)
     assert isinstance(farm.layout_y, np.ndarray)
 
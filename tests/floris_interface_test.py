@@ -72,5 +72,41 @@ def test_calculate_no_wake():
     assert fi.floris.farm.yaw_angles == yaw_angles
 
 
+def test_calculate_wake_below_cut_in():
+    """
+    The wake calculation for a wind condition below the cut-in wind speed should not
+    depend on the other wind conditions that are computed with it.
+    """
+    fi = FlorisInterface(configuration=YAML_INPUT)
+    fi.reinitialize(layout_x=[0.0, 630.0], layout_y=[0.0, 0.0], wind_speeds=[2.0])
+    fi.calculate_wake()
+    single_velocities = fi.turbine_average_velocities
+    np.testing.assert_array_equal(fi.get_turbine_powers(), 0.0)
+
+    fi.reinitialize(wind_speeds=[2.0, 8.0])
+    fi.calculate_wake()
+    batch_velocities = fi.turbine_average_velocities
+    np.testing.assert_allclose(batch_velocities[:, 0:1], single_velocities)
+    np.testing.assert_array_equal(fi.get_turbine_powers()[:, 0:1], 0.0)
+
+
+def test_sample_flow_at_points():
+    """
+    The flow sampled at a set of points should not change when the flow is later sampled at
+    another set of points.
+    """
+    fi = FlorisInterface(configuration=YAML_INPUT)
+    fi.reinitialize(layout_x=[0.0, 630.0], layout_y=[0.0, 0.0])
+
+    x = np.array([300.0, 900.0, 1500.0])
+    y = np.zeros(3)
+    z = 90.0 * np.ones(3)
+    u_first = fi.sample_flow_at_points(x, y, z)
+    u_first_copy = u_first.copy()
+
+    fi.sample_flow_at_points(x, y + 2000.0, z)
+    np.testing.assert_array_equal(u_first, u_first_copy)
+
+
 def test_reinitialize():
     pass
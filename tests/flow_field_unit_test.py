@@ -13,6 +13,8 @@
 # See https://floris.readthedocs.io for documentation
 
 
+import copy
+
 import numpy as np
 
 from floris.simulation import FlowField, TurbineGrid
@@ -56,6 +58,29 @@ def test_initialize_velocity_field(flow_field_fixture, turbine_grid_fixture: Tur
     assert np.array_equal(average, baseline)
 
 
+def test_shear_profiles(flow_field_fixture, turbine_grid_fixture: TurbineGrid):
+    wind_profile_plane, _ = flow_field_fixture.shear_profiles(turbine_grid_fixture)
+
+    # The profiles are reused for the same grid and shear parameters
+    cached_profile_plane, _ = flow_field_fixture.shear_profiles(turbine_grid_fixture)
+    assert cached_profile_plane is wind_profile_plane
+
+    # Changing the wind shear recomputes the profiles
+    flow_field_fixture.wind_shear = 1.0
+    wind_profile_plane, _ = flow_field_fixture.shear_profiles(turbine_grid_fixture)
+    assert np.allclose(
+        wind_profile_plane,
+        turbine_grid_fixture.z_sorted / flow_field_fixture.reference_wind_height
+    )
+
+    # Copies of the flow field do not carry the cached profiles
+    flow_field_fixture.initialize_velocity_field(turbine_grid_fixture)
+    flow_field_copy = copy.deepcopy(flow_field_fixture)
+    assert flow_field_copy._shear_profile_cache is None
+    assert np.array_equal(flow_field_copy.u_initial_sorted, flow_field_fixture.u_initial_sorted)
+    assert flow_field_copy.u_initial_sorted is not flow_field_fixture.u_initial_sorted
+
+
 def test_asdict(flow_field_fixture: FlowField, turbine_grid_fixture: TurbineGrid):
 
     flow_field_fixture.initialize_velocity_field(turbine_grid_fixture)
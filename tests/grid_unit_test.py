@@ -16,12 +16,20 @@
 import numpy as np
 import pytest
 
+from floris.simulation import TurbineGrid
 from floris.utilities import Vec3
 from tests.conftest import (
     N_TURBINES,
     N_WIND_DIRECTIONS,
     N_WIND_SPEEDS,
+    ROTOR_DIAMETER,
+    TIME_SERIES,
     TURBINE_GRID_RESOLUTION,
+    WIND_DIRECTIONS,
+    WIND_SPEEDS,
+    X_COORDS,
+    Y_COORDS,
+    Z_COORDS,
 )
 
 
@@ -54,6 +62,28 @@ def test_turbinegrid_set_grid(turbine_grid_fixture):
     assert not np.any(turbine_grid_fixture.z_sorted[0, 0] - expected_z_grid)
 
 
+def test_turbinegrid_coordinates_array(turbine_grid_fixture):
+    # Supplying the turbine coordinates as an array should give the same grid as
+    # building them from the Vec3 objects
+    coordinates_array = np.column_stack((X_COORDS, Y_COORDS, Z_COORDS))
+    turbine_grid = TurbineGrid(
+        turbine_coordinates=[Vec3(c) for c in coordinates_array],
+        turbine_coordinates_array=coordinates_array,
+        reference_turbine_diameter=ROTOR_DIAMETER * np.ones(N_TURBINES),
+        wind_directions=np.array(WIND_DIRECTIONS),
+        wind_speeds=np.array(WIND_SPEEDS),
+        grid_resolution=TURBINE_GRID_RESOLUTION,
+        time_series=TIME_SERIES,
+    )
+    np.testing.assert_array_equal(
+        turbine_grid.turbine_coordinates_array,
+        turbine_grid_fixture.turbine_coordinates_array,
+    )
+    np.testing.assert_array_equal(turbine_grid.x_sorted, turbine_grid_fixture.x_sorted)
+    np.testing.assert_array_equal(turbine_grid.y_sorted, turbine_grid_fixture.y_sorted)
+    np.testing.assert_array_equal(turbine_grid.z_sorted, turbine_grid_fixture.z_sorted)
+
+
 def test_turbinegrid_dimensions(turbine_grid_fixture):
     assert np.shape(turbine_grid_fixture.x_sorted) == (
         N_WIND_DIRECTIONS,
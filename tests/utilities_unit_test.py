@@ -21,6 +21,7 @@ import pytest
 
 from floris.utilities import (
     cosd,
+    reverse_rotate_coordinates_rel_west,
     rotate_coordinates_rel_west,
     sind,
     tand,
@@ -129,3 +130,40 @@ def test_rotate_coordinates_rel_west():
     np.testing.assert_almost_equal( X_COORDS[-1:-4:-1], x_rotated[0,0] )
     np.testing.assert_almost_equal( Y_COORDS, y_rotated[0,0] )
     np.testing.assert_almost_equal( Z_COORDS, z_rotated[0,0] )
+
+
+def test_reverse_rotate_coordinates_rel_west():
+
+    coordinates = np.array([ [x,y,z] for x,y,z in zip(X_COORDS, Y_COORDS, Z_COORDS)])
+
+    # Reversing the rotation should recover the original coordinates for each wind direction
+    wind_directions = np.array([270.0, 360.0, 90.0, 225.0])
+    x_rotated, y_rotated, z_rotated, x_center, y_center = rotate_coordinates_rel_west(
+        wind_directions,
+        coordinates
+    )
+    x_reversed, y_reversed, z_reversed = reverse_rotate_coordinates_rel_west(
+        wind_directions,
+        x_rotated[:, :, :, None, None],
+        y_rotated[:, :, :, None, None],
+        z_rotated[:, :, :, None, None],
+        x_center,
+        y_center,
+    )
+    for i in range(len(wind_directions)):
+        np.testing.assert_almost_equal( X_COORDS, x_reversed[i, 0, :, 0, 0] )
+        np.testing.assert_almost_equal( Y_COORDS, y_reversed[i, 0, :, 0, 0] )
+        np.testing.assert_almost_equal( Z_COORDS, z_reversed[i, 0, :, 0, 0] )
+
+    # The reversed grid should keep the floating point type of the given grid
+    x_reversed, y_reversed, z_reversed = reverse_rotate_coordinates_rel_west(
+        wind_directions,
+        x_rotated[:, :, :, None, None].astype(np.float32),
+        y_rotated[:, :, :, None, None].astype(np.float32),
+        z_rotated[:, :, :, None, None].astype(np.float32),
+        x_center,
+        y_center,
+    )
+    assert x_reversed.dtype == np.float32
+    assert y_reversed.dtype == np.float32
+    assert z_reversed.dtype == np.float32